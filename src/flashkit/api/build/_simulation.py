@@ -44,23 +44,22 @@ def adapt_arguments(**args: Any) -> dict[str, Any]:
         grid = {'paramesh': 'pm4dev', 'uniform': 'ug', 'regular': 'rg'}.get(args['grid'], args['grid'].strip('-+'))
         sub = args['subpath'].rstrip('/')
         sim = args['path'].rstrip('/')
-        objdir = f"{grid}{args['name']}_{nxb}_{nyb}" + '' if ndim == 2 else f'_{nzb}'
+        objdir = f"{grid}{args['name']}_{nxb}_{nyb}" + ('' if ndim == 2 else f'_{nzb}')
         python = './setup' if max(min(3, args['python']), 2) == 2 else './setup3'
         flag = args['optimize'].strip('-+')
-        parallelIO = '' if not args.get('parallelIO', False) else ' +parallelIO'
-        shortcuts = '' if not args.get('shortcuts', False) else ' +' + ' +'.join(args['shortcuts'])
-        options = '' if not args.get('flags', False) else ' -' + ' -'.join(args['flags'])
-        variables = ' '.join([f'-{name}={value}' for name, value in args.get('variables', {}).items()])
+        parallelIO = [] if not args.get('parallelIO', False) else ['+parallelIO']
+        shortcuts = [f'+{shortcut}' for shortcut in args.get('shortcuts', None) or []]
+        options = [f'-{option}' for option in args.get('flags', None) or []]
+        variables = [f'-{name}={value}' for name, value in args.get('variables', {}).items()]
         site = args['site']
     except:
         raise AutoError('Failed to understand and validate input!')
     logger.debug(f'api -- Validated user input and formated options.')
 
     # create setup command
-    args['setup'] = f'{python} {sub}/{sim}/ +{grid} +hdf5{parallelIO}{shortcuts}' \
-                    f' -auto -{flag}{options} -objdir={objdir} -site={site}' \
-                    f' -{ndim}d -nxb={nxb} -nyb={nyb}{f" -nzb={nzb}" if ndim == 3 else ""}' \
-                    f'{variables}'.split()
+    args['setup'] = [python, f'{sub}/{sim}/', f'+{grid}', '+hdf5', *parallelIO, *shortcuts, 
+                     '-auto', f'-{flag}', *options, f'-objdir={objdir}', f'-site={site}', 
+                     f'-{ndim}d', f'-nxb={nxb}', f'-nyb={nyb}', *([f'-nzb={nzb}'] if ndim == 3 else []), *variables]
     args['name'] = objdir
     logger.debug(f'api -- Constructed setup command.')
 
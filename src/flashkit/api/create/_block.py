@@ -13,6 +13,7 @@ import sys
 from ...core.parallel import safe, single, squash
 from ...core.progress import get_bar
 from ...core.stream import Instructions, mail
+from ...core.tools import resolve_path
 from ...library.create_block import calc_blocks, write_blocks
 from ...library.create_grid import read_coords
 from ...resources import CONFIG, DEFAULTS
@@ -36,6 +37,7 @@ LINEWIDTH = CONFIG['create']['block']['linewidth']
 OPTIONPAD = CONFIG['create']['block']['optionpad']
 TABLESPAD = CONFIG['create']['block']['tablespad']
 PRECISION = CONFIG['create']['block']['precision']
+THRESHOLD = CONFIG['create']['block']['threshold']
 
 def adapt_arguments(**args: Any) -> dict[str, Any]:
     """Process arguments to implement behaviors; will throw if some defaults missing."""
@@ -46,23 +48,20 @@ def adapt_arguments(**args: Any) -> dict[str, Any]:
     args['sizes'] = tuple(args[k] if n < ndim else 1 for n, k in enumerate(('nxb', 'nyb', 'nzb')))
 
     # build flows dictionary
-    zloc = GRIDS[-1]
-    used = lambda grid: ndim == 3 or grid != zloc
-    args['flows'] = {field: (location, args.get('fmethod', {}).get(field, METHOD)) 
-            for field, location in args['fields'].items() if used(location)}
+    unused = set() if ndim == 3 else {GRIDS[-1]}
+    fmethod = args.get('fmethod', {})
+    args['flows'] = {field: (location, fmethod.get(field, METHOD)) 
+            for field, location in args['fields'].items() if location not in unused}
 
     # build paramaters dictionary
     args['params'] = {}
     for field, param in args.get('fparam', {}).items(): 
         for key, value in param.items():
-            if key in args['params']:
-                args['params'][key][field] = value
-            else:
-                args['params'][key] = {field: value}
+            args['params'].setdefault(key, {})[field] = value
 
     # resolve proper absolute directory paths
-    args['path'] = os.path.realpath(os.path.expanduser(args['path']))
-    args['dest'] = os.path.realpath(os.path.expanduser(args['dest']))
+    args['path'] = resolve_path(args['path'])
+    args['dest'] = resolve_path(args['dest'])
 
     return args
 
@@ -99,7 +98,7 @@ def log_messages(**args: Any) -> dict[str, Any]:
 # default constants for handling the argument stream
 PACKAGES = {'ndim', 'nxb', 'nyb', 'nzb', 'iprocs', 'jprocs', 'kprocs', 'fields', 'fmethod', 'fparam', 'dest', 'path', 'result', 'nofile'}
 ROUTE = ('create', 'block')
-PRIORITY = {'ignore', 'cmdline', 'coords'}
+PRIORITY = {'ignore', 'cmdline', 'coords', 'full'}
 CRATES = (adapt_arguments, log_messages, attach_context)
 DROPS = {'ignore', 'nxb', 'nyb', 'nzb', 'iprocs', 'jprocs', 'kprocs', 'fields', 'fmethod', 'fparam'}
 INSTRUCTIONS = Instructions(packages=PACKAGES, route=ROUTE, priority=PRIORITY, crates=CRATES, drops=DROPS)
@@ -111,11 +110,14 @@ def process_arguments(**arguments: Any) -> dict[str, Any]:
     return arguments
 
 @squash
-def screen_out(*, blocks: Blocks) -> None:
-    """Output calculated fields by block to the screen."""
-    with numpy.printoptions(precision=PRECISION, linewidth=LINEWIDTH, threshold=numpy.inf):
-        message = "\n\n".join(f'{f}:\n{b}' for f, b in blocks.items())
-        print(f'\nFields for blocks on root are as follows:\n{message}')
+def screen_out(*, blocks: Blocks, full: bool = False) -> None:
+    """Output calculated fields by block to the screen; summarizing large fields unless full."""
+    threshold = sys.maxsize if full else THRESHOLD
+    with numpy.printoptions(precision=PRECISION, linewidth=LINEWIDTH, threshold=threshold):
+        sys.stdout.write('\nFields for blocks on root are as follows:\n')
+        sys.stdout.writelines(f'\n{field}:\n{data}\n' if index else f'{field}:\n{data}\n'
+                for index, (field, data) in enumerate(blocks.items()))
+        sys.stdout.flush()
 
 @safe
 def block(**arguments: Any) -> Optional[Blocks]:
@@ -139,6 +141,7 @@ def block(**arguments: Any) -> Optional[Blocks]:
         dest (str):      Path to initial block hdf5 file.
         ignore (bool):   Ignore configuration file provided arguments, options, and flags.
         result (bool):   Return the calculated fields by block on root.
+        full (bool):     Output the full (i.e., not summarized) fields to the screen (command line only).
         nofile (bool):   Do not write the calculated fields by block to file.
 
     Note:
@@ -153,6 +156,7 @@ def block(**arguments: Any) -> Optional[Blocks]:
     result = args.pop('result')
     nofile = args.pop('nofile')
     cmdline = args.pop('cmdline', False)
+    full = args.pop('full', False)
     coords = args.pop('coords', None)
     
     with args.pop('context')() as progress:
@@ -163,5 +167,5 @@ def block(**arguments: Any) -> Optional[Blocks]:
         if not nofile: write_blocks(blocks=blocks, index=index, path=path, shapes=shapes)
     
     if not result: return None
-    if cmdline: screen_out(blocks=blocks)
+    if cmdline: screen_out(blocks=blocks, full=full)
     return blocks
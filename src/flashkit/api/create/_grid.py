@@ -13,6 +13,7 @@ import sys
 from ...core.parallel import safe, single, squash
 from ...core.progress import get_bar
 from ...core.stream import Instructions, mail
+from ...core.tools import resolve_path
 from ...library.create_grid import calc_coords, write_coords
 from ...resources import CONFIG, DEFAULTS
 from ...support.types import Coords
@@ -50,10 +51,7 @@ def adapt_arguments(**args: Any) -> dict[str, Any]:
     args['params'] = {}
     for axis, param in zip(AXES, (args.get(k, {}) for k in ('xparam', 'yparam', 'zparam'))): 
         for key, value in param.items():
-            if key in args['params']:
-                args['params'][key][axis] = value
-            else:
-                args['params'][key] = {axis: value}
+            args['params'].setdefault(key, {})[axis] = value
 
     # deal with bounding box of simulation domain
     if bndbox_given and len(args['bndbox']) >= 2 * args['ndim']:
@@ -65,8 +63,8 @@ def adapt_arguments(**args: Any) -> dict[str, Any]:
         args['ranges_high'] = tuple(args[key][1] for key in ('xrange', 'yrange', 'zrange'))
 
     # resolve proper absolute directory paths
-    args['path'] = os.path.realpath(os.path.expanduser(args['path']))
-    args['dest'] = os.path.realpath(os.path.expanduser(args['dest']))
+    args['path'] = resolve_path(args['path'])
+    args['dest'] = resolve_path(args['dest'])
 
     return args
 
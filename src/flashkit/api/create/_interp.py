@@ -15,6 +15,7 @@ from ...core.error import AutoError
 from ...core.parallel import safe, single, squash
 from ...core.progress import get_bar
 from ...core.stream import Instructions, mail
+from ...core.tools import resolve_path
 from ...library.create_grid import read_coords
 from ...library.create_interp import interp_blocks
 from ...resources import CONFIG, DEFAULTS
@@ -36,6 +37,7 @@ SWITCH = CONFIG['create']['interp']['switch']
 LINEWIDTH = CONFIG['create']['interp']['linewidth']
 TABLESPAD = CONFIG['create']['interp']['tablespad']
 PRECISION = CONFIG['create']['interp']['precision']
+THRESHOLD = CONFIG['create']['interp']['threshold']
 
 def adapt_arguments(**args: Any) -> dict[str, Any]:
     """Process arguments to implement behaviors; will throw if some defaults missing."""
@@ -49,28 +51,29 @@ def adapt_arguments(**args: Any) -> dict[str, Any]:
         bname_given = 'basename' in args.keys()
     
     # resolve proper absolute directory paths
-    args['path'] = os.path.realpath(os.path.expanduser(args['path']))
-    args['dest'] = os.path.realpath(os.path.expanduser(args['dest']))
+    args['path'] = resolve_path(args['path'])
+    args['dest'] = resolve_path(args['dest'])
     path = args['path']
 
-    # prepare conditions in order to arrange a list of files to process
+    # prepare conditions in order to arrange a list of files to process (single pass over the directory)
     str_include = re.compile(args['plot'])
     str_exclude = re.compile(args['force'])
     if not step_given or not bname_given:
-        listdir = os.listdir(path)
-        orig_cond = lambda file: re.search(str_include, file) and not re.search(str_exclude, file)
+        include, exclude = str_include.search, str_exclude.search
+        with os.scandir(path) as entries:
+            matches = [entry.name for entry in entries if include(entry.name) and not exclude(entry.name) and entry.is_file()]
 
     # create the basename
     if not bname_given:
-        try:
-            args['basename'], *_ = next(filter(orig_cond, (file for file in listdir))).split(str_include.pattern)
-        except StopIteration:
+        if not matches:
             raise AutoError(f'Cannot automatically parse basename for simulation files on path {path}')
-    full_cond = lambda file: orig_cond(file) and re.search(re.compile(args['basename']), file)
+        args['basename'], *_ = matches[0].split(str_include.pattern)
+    str_basename = re.compile(args['basename'])
 
     # find the source file
     if not step_given:
-        step = sorted([int(file[-4:]) for file in listdir if full_cond(file)])[-1]
+        basename = str_basename.search
+        step = max((int(file[-4:]) for file in matches if file[-4:].isdecimal() and basename(file)), default=None)
         if not step: raise AutoError(f'Cannot automatically identify simulation file on path {path}')
         args['step'] = step
 
@@ -80,10 +83,10 @@ def adapt_arguments(**args: Any) -> dict[str, Any]:
     args['sizes'] = tuple(args[k] if n < ndim else 1 for n, k in enumerate(('nxb', 'nyb', 'nzb')))
 
     # build flows dictionary
-    zloc = GRIDS[-1]
-    used = lambda grid: ndim == 3 or grid != zloc
-    args['flows'] = {field: (location, *args.get('fsource', {}).get(field, [field, location]))
-            for field, location in args['fields'].items() if used(location)}
+    unused = set() if ndim == 3 else {GRIDS[-1]}
+    fsource = args.get('fsource', {})
+    args['flows'] = {field: (location, *fsource.get(field, [field, location]))
+            for field, location in args['fields'].items() if location not in unused}
 
     return args
 
@@ -126,7 +129,7 @@ def log_messages(**args: Any) -> dict[str, Any]:
 PACKAGES = {'ndim', 'nxb', 'nyb', 'nzb', 'iprocs', 'jprocs', 'kprocs', 'fields', 'fsource',
             'basename', 'step', 'plot', 'grid', 'force', 'path', 'dest', 'auto', 'find', 'result', 'nofile'}
 ROUTE = ('create', 'interp')
-PRIORITY = {'ignore', 'cmdline', 'coords'}
+PRIORITY = {'ignore', 'cmdline', 'coords', 'full'}
 CRATES = (adapt_arguments, log_messages, attach_context)
 DROPS = {'ignore', 'auto', 'find', 'force', 'nxb', 'nyb', 'nzb', 'iprocs', 'jprocs', 'kprocs', 'fields', 'fsource'}
 MAPPING = {'grid': 'gridname', 'plot': 'filename'}
@@ -139,11 +142,14 @@ def process_arguments(**arguments: Any) -> dict[str, Any]:
     return arguments
 
 @squash
-def screen_out(*, blocks: Blocks) -> None:
-    """Output calculated fields by block to the screen."""
-    with numpy.printoptions(precision=PRECISION, linewidth=LINEWIDTH, threshold=numpy.inf):
-        message = "\n\n".join(f'{f}:\n{b}' for f, b in blocks.items())
-        print(f'\nFields for blocks on root are as follows:\n{message}')
+def screen_out(*, blocks: Blocks, full: bool = False) -> None:
+    """Output calculated fields by block to the screen; summarizing large fields unless full."""
+    threshold = sys.maxsize if full else THRESHOLD
+    with numpy.printoptions(precision=PRECISION, linewidth=LINEWIDTH, threshold=threshold):
+        sys.stdout.write('\nFields for blocks on root are as follows:\n')
+        sys.stdout.writelines(f'\n{field}:\n{data}\n' if index else f'{field}:\n{data}\n'
+                for index, (field, data) in enumerate(blocks.items()))
+        sys.stdout.flush()
 
 @safe
 def interp(**arguments: Any) -> Optional[Blocks]:
@@ -174,6 +180,7 @@ def interp(**arguments: Any) -> Optional[Blocks]:
         find (bool):     Force behavior to attempt guessing [--step INT].
         nofile (bool):   Do not write the calculated fields by block to file.
         result (bool):   Return the calculated fields by block on root.
+        full (bool):     Output the full (i.e., not summarized) fields to the screen (command line only).
         ignore (bool):   Ignore configuration file provided arguments, options, and flags.
 
     Note:
@@ -187,6 +194,7 @@ def interp(**arguments: Any) -> Optional[Blocks]:
     sizes = args.pop('sizes')
     result = args.pop('result')
     cmdline = args.pop('cmdline', False)
+    full = args.pop('full', False)
     coords = args.pop('coords', None)
     
     if coords is None: coords = read_coords(path=path, ndim=ndim)
@@ -196,5 +204,5 @@ def interp(**arguments: Any) -> Optional[Blocks]:
     blocks = interp_blocks(bndboxes=boxes, centers=centers, dest=path, grids=grids, ndim=ndim, procs=procs, shapes=shapes, **args)
     
     if not result: return None
-    if cmdline: screen_out(blocks=blocks)
+    if cmdline: screen_out(blocks=blocks, full=full)
     return blocks
@@ -16,7 +16,7 @@ from ...core.error import AutoError
 from ...core.parallel import safe, single, squash
 from ...core.progress import attach_context 
 from ...core.stream import Instructions, mail
-from ...core.tools import read_a_leaf
+from ...core.tools import read_a_leaf, resolve_path
 from ...library.create_par import author_par, filter_tags, sort_templates, write_par
 from ...resources import CONFIG, TEMPLATES
 from ...support.types import Template, Tree
@@ -56,12 +56,16 @@ def adapt_arguments(**args: Any) -> dict[str, Any]:
         logger.debug(f'api -- Using provided or defaults for templates and sources.')
 
     # resolve proper absolute directory paths
-    args['dest'] = os.path.realpath(os.path.expanduser(args['dest']))
+    args['dest'] = resolve_path(args['dest'])
     logger.debug(f'api -- Fully resolved the destination path.')
 
-    # find the templates 
+    # find the lookup for sources
+    ignore = args.get('ignore', False)
+    args['tree'] = get_defaults() if ignore else get_arguments()
+
+    # find the templates (reusing the lookup for sources if it was built from configuration files)
     if not templates_given:
-        arguments = get_arguments()
+        arguments = get_arguments() if ignore else args['tree']
         args['templates'] = list(dict.fromkeys([template 
             for space, paths in reversed(arguments.whereis(TEMPLATE).items())
             for path in paths 
@@ -75,9 +79,6 @@ def adapt_arguments(**args: Any) -> dict[str, Any]:
                 if source not in NOSOURCE]
         logger.debug(f'api -- Used the library default sources.')
 
-    # find the lookup for sources
-    args['tree'] = get_defaults() if args.get('ignore', False) else get_arguments()
-
     # read and combine the templates
     files = [file + '.toml' for file in args['templates']]
     if 'params' in args:
@@ -15,6 +15,7 @@ from ...core.error import AutoError
 from ...core.parallel import safe, single 
 from ...core.progress import get_bar
 from ...core.stream import Instructions, mail
+from ...core.tools import resolve_path
 from ...library.create_xdmf import create_xdmf
 from ...resources import CONFIG, DEFAULTS
 
@@ -44,24 +45,24 @@ def adapt_arguments(**args: Any) -> dict[str, Any]:
         bname_given = 'basename' in args.keys()
     
     # resolve proper absolute directory paths
-    args['path'] = os.path.realpath(os.path.expanduser(args['path']))
-    args['dest'] = os.path.realpath(os.path.expanduser(args['dest']))
+    args['path'] = resolve_path(args['path'])
+    args['dest'] = resolve_path(args['dest'])
     source = args['path']
 
     # prepare conditions in order to arrange a list of files to process
     str_include = re.compile(args['plot'])
     str_exclude = re.compile(args['force'])
-    if (not files_given and not range_given) or not bname_given:
-        listdir = os.listdir(source)
-        orig_cond = lambda file: re.search(str_include, file) and not re.search(str_exclude, file)
+    orig_cond = lambda file: str_include.search(file) and not str_exclude.search(file)
 
-    # create the basename
+    # create the basename (streaming the directory; stopping at the first match)
     if not bname_given:
         try:
-            args['basename'], *_ = next(filter(orig_cond, (file for file in listdir))).split(str_include.pattern)
+            with os.scandir(source) as entries:
+                args['basename'], *_ = next(filter(orig_cond, (entry.name for entry in entries))).split(str_include.pattern)
         except StopIteration:
             raise AutoError(f'Cannot automatically parse basename for simulation files on path {source}')
-    full_cond = lambda file: orig_cond(file) and re.search(re.compile(args['basename']), file)
+    str_basename = re.compile(args['basename'])
+    full_cond = lambda file: orig_cond(file) and str_basename.search(file)
     
     # create the filelist (throw if not defaults present)
     low: int = args['low']
@@ -74,7 +75,8 @@ def adapt_arguments(**args: Any) -> dict[str, Any]:
             files = range(low, high, skip)
             args['message'] = f'range({low}, {high}, {skip})'
         else:
-            files = sorted([int(file[-4:]) for file in listdir if full_cond(file)])
+            with os.scandir(source) as entries:
+                files = sorted([int(entry.name[-4:]) for entry in entries if entry.name[-4:].isdecimal() and full_cond(entry.name)])
             args['message'] = f'[{",".join(str(f) for f in files[:(min(5, len(files)))])}{", ..." if len(files) > 5 else ""}]'
             if not files:
                 raise AutoError(f'Cannot automatically identify simulation files on path {source}')
@@ -44,6 +44,7 @@ options:
 flags:
 -F, --nofile         Do not write the calculated coordinates to file. 
 -R, --result         Return the calculated fields by block on root. 
+-U, --full           Output the full (i.e., not summarized) fields to the screen; used with --result.
 -I, --ignore         Ignore configuration file provided arguments, options, and flags.
 -O, --options        Show the available options (i.e., defaults and config file format) and exit.
 -h, --help           Show this message and exit.
@@ -79,6 +80,7 @@ class BlockCreateApp(Application):
     interface.add_argument('-d', '--dest')
     interface.add_argument('-F', '--nofile', action='store_true')
     interface.add_argument('-R', '--result', action='store_true')
+    interface.add_argument('-U', '--full', action='store_true')
     interface.add_argument('-I', '--ignore', action='store_true')
     interface.add_argument('-O', '--options', action='store_true')
 
@@ -90,6 +92,6 @@ class BlockCreateApp(Application):
             return
 
         options ={'ndim', 'nxb', 'nyb', 'nzb', 'iprocs', 'jprocs', 'kprocs', 'fields', 'fmethod', 'fparam', 
-                  'path', 'dest', 'ignore', 'result', 'nofile'}
+                  'path', 'dest', 'ignore', 'result', 'nofile', 'full'}
         local = {key: getattr(self, key) for key in options}
         block(**local, cmdline=True)
@@ -53,6 +53,7 @@ flags:
 -B, --find           Force behavior to attempt guessing [--step INT].
 -F, --nofile         Do not write the calculated coordinates to file. 
 -R, --result         Return the calculated fields by block on root. 
+-U, --full           Output the full (i.e., not summarized) fields to the screen; used with --result.
 -I, --ignore         Ignore configuration file provided arguments, options, and flags.
 -O, --options        Show the available options (i.e., defaults and config file format) and exit.
 -h, --help           Show this message and exit.
@@ -95,6 +96,7 @@ class InterpCreateApp(Application):
     interface.add_argument('-B', '--find', action='store_true')
     interface.add_argument('-F', '--nofile', action='store_true')
     interface.add_argument('-R', '--result', action='store_true')
+    interface.add_argument('-U', '--full', action='store_true')
     interface.add_argument('-I', '--ignore', action='store_true')
     interface.add_argument('-O', '--options', action='store_true')
 
@@ -106,6 +108,6 @@ class InterpCreateApp(Application):
             return
 
         options ={'ndim', 'nxb', 'nyb', 'nzb', 'iprocs', 'jprocs', 'kprocs', 'fields', 'fsource', 'step', 
-                  'plot', 'grid', 'force', 'path', 'dest', 'auto', 'find', 'ignore', 'result', 'nofile'}
+                  'plot', 'grid', 'force', 'path', 'dest', 'auto', 'find', 'ignore', 'result', 'nofile', 'full'}
         local = {key: getattr(self, key) for key in options}
         interp(**local, cmdline=True)
@@ -11,6 +11,7 @@ import threading
 import time
 import sys
 from contextlib import AbstractContextManager, nullcontext
+from functools import lru_cache
 
 # internal libraries
 from .parallel import is_parallel
@@ -122,7 +123,12 @@ class SimpleBar(threading.Thread):
 def get_bar(*, null: bool = False) -> Bar:
     """Retrives the best supported progress bar at runtime."""
     if null: return null_bar #NULL_BAR 
-    if is_parallel(): return SimpleBar
+    return find_bar(is_parallel())
+
+@lru_cache(maxsize=None)
+def find_bar(parallel: bool) -> Bar:
+    """(internal) - resolve (once per runtime environment) the best supported progress bar."""
+    if parallel: return SimpleBar
     try:
         pkg_resources.get_distribution('alive_progress')
         from alive_progress import alive_bar, config_handler # type: ignore
@@ -95,11 +95,12 @@ def mail(packages: Iterable[str], route: Sequence[str], priority: Iterable[str],
          crates: Sequence[C], drops: Iterable[str], mapping: Mapping[str, str]) -> D:
     """Ship crated, pruned, and translated packages; applies ship-build-prune."""
     def decorator(function: F) -> F:
+        composed = ship(packages, route, priority)(build(crates)(prune(drops, mapping)(function)))
         @wraps(function)
         @handler
         def wrapper(**stream):
             logger.debug(f'Mail -- Provided: {stream.keys()}')
-            return ship(packages, route, priority)(build(crates)(prune(drops, mapping)(function)))(**stream)
+            return composed(**stream)
         return cast(F, wrapper)
     return decorator
 
@@ -138,10 +139,11 @@ def patch(function: F) -> F:
 def prune(drops: Iterable[str], mapping: Mapping[str, str]) -> D:
     """Prepare the stream; applies strip-translate"""
     def decorator(function: F) -> F:
+        composed = strip(drops)(translate(mapping)(function))
         @wraps(function)
         def wrapper(**stream):
             logger.debug(f'Prune -- Provided: {stream.keys()}')
-            return strip(drops)(translate(mapping)(function))(**stream)
+            return composed(**stream)
         return cast(F, wrapper)
     return decorator
 
@@ -165,10 +167,11 @@ def unpack(route: Sequence[str], priority: Iterable[str]) -> D:
 def ship(packages: Iterable[str], route: Sequence[str], priority: Iterable[str]) -> D:
     """Ship packages; applies pack-patch-unpack"""
     def decorator(function: F) -> F:
+        composed = pack(packages, route, priority)(patch(unpack(route, priority)(function)))
         @wraps(function)
         def wrapper(**stream):
             logger.debug(f'Ship -- Provided: {stream.keys()}')
-            return pack(packages, route, priority)(patch(unpack(route, priority)(function)))(**stream)
+            return composed(**stream)
         return cast(F, wrapper)
     return decorator
 
@@ -9,13 +9,13 @@ from collections.abc import MutableMapping
 import logging
 from contextlib import contextmanager
 from functools import reduce
-from os import chdir
+from os import chdir, path as ospath
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 # define library (public) interface
-__all__ = ['change_directory, first_true', 'is_ipython', 'read_a_branch', 'read_a_leaf', ]
+__all__ = ['change_directory', 'first_true', 'is_ipython', 'read_a_branch', 'read_a_leaf', 'resolve_path', ]
 
 @contextmanager
 def change_directory(path: Union[Path, str]) -> Iterator[None]:
@@ -53,3 +53,7 @@ def read_a_branch(stem: list[str], tree: MutableMapping[str, Any]) -> MutableMap
         return dict(reduce(lambda branch, leaf: branch[leaf], stem, tree))
     except KeyError:
         return dict()
+
+def resolve_path(path: str) -> str:
+    """Resolve a user provided path to an absolute real path."""
+    return ospath.realpath(ospath.expanduser(path))
@@ -51,7 +51,7 @@ def write_blocks(*, blocks: Blocks, index: parallel.Index, path: str, shapes: Sh
     with H5Manager(filename, 'w-', clean=True) as h5file:
         for field, data in blocks.items():
             shape = (shapes['center'][0], ) + data.shape[1:] 
-            h5file.write(field, data, index=index, shape=shape)
+            h5file.write(field, data, index=index, shape=shape, chunks=(1, ) + shape[1:])
 
 def get_filledBlocks(*, grids: Grids, locations: dict[str, str], mesh: Mesh, methods: Flowing, shapes: Shapes) -> Blocks:
     blocks: Blocks = cast(Blocks, {field: None for field in locations.keys()})
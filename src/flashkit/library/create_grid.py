@@ -10,7 +10,7 @@ import os
 # internal libraries
 from ..core.parallel import Index, safe, single, squash
 from ..resources import CONFIG 
-from ..support.grid import axisMesh, indexSize_fromLocal
+from ..support.grid import indexSize_fromLocal
 from ..support.stretch import Stretching
 from ..support.types import N, M, Coords 
 
@@ -32,8 +32,8 @@ def calc_coords(*, ndim: int, params: dict[str, dict[str, Any]], path: str, proc
                 sizes: tuple[int, int, int], stypes: tuple[str, str, str]) -> Coords:
     """Calculate global coordinate axis arrays; face data vice cell data."""
 
-    # create grid init parameters
-    gr_axisNumProcs, gr_axisMesh = axisMesh(*procs)
+    # create grid init parameters (the full process mesh is not needed here)
+    gr_axisNumProcs = numpy.array(procs, int)
     gr_min, gr_max = numpy.array(smins, float), numpy.array(smaxs, float)
     gr_lIndexSize, gr_gIndexSize = indexSize_fromLocal(*sizes, gr_axisNumProcs)
 
@@ -47,7 +47,7 @@ def calc_coords(*, ndim: int, params: dict[str, dict[str, Any]], path: str, proc
 def read_coords(*, ndim: int, path: str) -> Coords:
     """Read global coordinate axis arrays from an hdf5 file."""
     coords: M = cast(M, [None, None, None])
-    filename = path + '/' + NAME
+    filename = os.path.join(path, NAME)
     with h5py.File(filename, 'r') as h5file:
         for index, axis in enumerate(AXES[:ndim]):
             coords[index] = h5file[axis + LABEL][:]
@@ -57,11 +57,13 @@ def read_coords(*, ndim: int, path: str) -> Coords:
 @squash
 def write_coords(*, coords: Coords, ndim: int, path: str) -> None:
     """Write global coordinate axis arrays to an hdf5 file."""
-    filename = path + '/' + NAME
+    filename = os.path.join(path, NAME)
     with h5py.File(filename, 'w') as h5file:
         for axis, coord in zip(AXES[:ndim], coords[:ndim]):
             if coord is not None:
-                h5file.create_dataset(axis + LABEL, data=coord)
+                coord = numpy.ascontiguousarray(coord, dtype=float)
+                dset = h5file.create_dataset(axis + LABEL, shape=coord.shape, dtype=coord.dtype)
+                dset.write_direct(coord)
 
 def get_filledCoords(*, sizes: N, methods: Stretching, ndim: int, smin: N, smax: N) -> Coords:
     """(internal) - fill coordinate axis array by iterating through methods."""
@@ -70,9 +72,8 @@ def get_filledCoords(*, sizes: N, methods: Stretching, ndim: int, smin: N, smax:
     coords: M = cast(M, [None, None, None])
     
     # fill by iterating over methods and dispatching
-    for method, func in methods.stretch.items():
-        if methods.any_axes(method):
-            func(axes=methods.map_axes(method), coords=coords, sizes=sizes, ndim=ndim, smin=smin, smax=smax)
+    for func, axes in methods.active:
+        func(axes=axes, coords=coords, sizes=sizes, ndim=ndim, smin=smin, smax=smax)
     
     # return as tuple 
     x, y, z = coords
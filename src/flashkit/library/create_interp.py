@@ -77,16 +77,20 @@ def interp_blocks(*, basename: str, bndboxes: N, centers: N, dest: str, filename
         lw_shapes = get_shapes(ndim=lw_ndim, procs=lw_axisNumProcs, sizes=lw_sizes)
         del faxes, uinds, coords
 
-    # open input and output files for performing the interpolation (writing the data as we go is most memory efficient)
+    # open input and output files for performing the interpolation (writing the local blocks of each field at once)
     with H5Manager(lw_blk_name, 'r', force=True) as inp_file, \
             H5Manager(gr_blk_name, 'w-', clean=True, nofile=nofile) as out_file, \
             context(gr_lIndex.size) as progress:
 
-        # create datasets in output file
+        # create output buffers for the local blocks
         output = {}
         for field, (location, _, _) in flows.items():
-            out_file.create_dataset(field, shape=shapes[location], dtype=float)
-            output[field] = numpy.empty((gr_lIndex.size, ) + shapes[location][1:], numpy.double)
+            output[field] = numpy.empty((gr_lIndex.width, ) + shapes[location][1:], numpy.double)
+
+        # locate each low grid block along the unique block center coordinates (once, for all working blocks)
+        lw_unq_center = [numpy.unique(lw_centers[:, axis]) for axis in range(3)]
+        lw_unq_bindex = numpy.column_stack([numpy.searchsorted(lw_unq_center[axis], lw_centers[:, axis]) for axis in range(3)])
+        lw_datasets = {lw_fld: inp_file.read(lw_fld) for _, lw_fld, _ in flows.values()}
         
         # interpolate over assigned blocks
         for step, (block, mesh, bbox) in enumerate(zip(gr_lIndex.range, gr_lMesh, bndboxes[gr_lIndex.range])):
@@ -96,70 +100,87 @@ def interp_blocks(*, basename: str, bndboxes: N, centers: N, dest: str, filename
             progress.text(f'from {lw_blocks}')
 
             # gather necessary information to flatten source data from low grid
-            lw_unq_center = [numpy.unique(lw_centers[:, axis]) for axis in range(3)]
-            lw_flt_center = [numpy.unique(lw_centers[lw_blocks, axis]) for axis in range(3)]
-            lw_flt_extent = [len(axis) for axis in lw_flt_center]
-            lw_flt_bindex = [[numpy.where(lw_flt_center[axis] == coord)[0][0] 
-                for axis, coord in enumerate(block)] for block in lw_centers[lw_blocks]]
-            lw_flt_uindex = [numpy.unique([numpy.where(lw_unq_center[axis] == coord[axis])[0][0] 
-                for coord in lw_centers[lw_blocks]]) for axis in range(3)]
+            lw_blk_uindex = lw_unq_bindex[lw_blocks]
+            lw_flt_uindex = [numpy.unique(lw_blk_uindex[:, axis]) for axis in range(3)]
+            lw_flt_extent = [len(axis) for axis in lw_flt_uindex]
+            lw_flt_bindex = numpy.column_stack([numpy.searchsorted(lw_flt_uindex[axis], lw_blk_uindex[:, axis]) 
+                for axis in range(3)]).tolist()
+
+            # source axes, destination points, and weights are shared by fields with the same locations
+            lw_meshes = {}
 
             # interpolate each field for the working block
             for field, (gr_loc, lw_fld, lw_loc) in flows.items():
 
                 # calculate flattened source data shape on low grid
                 lw_flt_fshape = [extent * size for extent, size in zip(lw_flt_extent, lw_shapes[lw_loc][:0:-1])]
+                lw_blk_values = lw_datasets[lw_fld][lw_blocks]
+
+                # gather source axes and destination points (reversed to match the axis order of the data)
+                if (gr_loc, lw_loc) not in lw_meshes:
+                    axes = tuple(lw_grids[lw_loc][a][lw_flt_uindex[a]].flatten() for a in range(lw_ndim))[::-1] # type: ignore
+                    points = tuple(grids[gr_loc][a][mesh[a]] for a in range(lw_ndim))[::-1] # type: ignore
+                    lw_meshes[gr_loc, lw_loc] = axes, points, mesh_weights(axes, points) if METHOD == 'linear' else None
+                axes, points, weights = lw_meshes[gr_loc, lw_loc]
 
                 if lw_ndim == 3:
                 
                     # interpolate cell center fields
-                    xxx = lw_grids[lw_loc][0][lw_flt_uindex[0]].flatten() # type: ignore
-                    yyy = lw_grids[lw_loc][1][lw_flt_uindex[1]].flatten() # type: ignore
-                    zzz = lw_grids[lw_loc][2][lw_flt_uindex[2]].flatten() # type: ignore
-                    values = numpy.empty(lw_flt_fshape[0::-1], dtype=float)
-                    for (i, j, k), source in zip(lw_flt_bindex, lw_blocks):
+                    values = numpy.empty(lw_flt_fshape[::-1], dtype=float)
+                    for (i, j, k), source in zip(lw_flt_bindex, lw_blk_values):
                         il, ih = i * lw_sizes[0], (i + 1) * lw_sizes[0]
                         jl, jh = j * lw_sizes[1], (j + 1) * lw_sizes[1]
                         kl, kh = k * lw_sizes[2], (k + 1) * lw_sizes[2]
-                        values[kl:kh, jl:jh, il:ih] = inp_file.read(lw_fld)[source]
+                        values[kl:kh, jl:jh, il:ih] = source
 
-                    x = grids[gr_loc][0][mesh[0], None, None, :] # type: ignore
-                    y = grids[gr_loc][1][mesh[1], None, :, None] # type: ignore
-                    z = grids[gr_loc][2][mesh[2], :, None, None] # type: ignore
-                
                     output[field][step] = numpy.maximum(numpy.minimum(
-                        interpn((zzz, yyy, xxx), values, (z, y, x), method=METHOD, bounds_error=False, fill_value=None),
-                        values.max()), values.min())
-                    out_file.write_partial(field, output[field][step], block=block, index=gr_lIndex) 
+                        interp_mesh(axes, values, points, weights), values.max()), values.min())
 
                 elif lw_ndim == 2:
             
                     # interpolate cell center fields
-                    xxx = lw_grids[lw_loc][0][lw_flt_uindex[0]].flatten() # type: ignore
-                    yyy = lw_grids[lw_loc][1][lw_flt_uindex[1]].flatten() # type: ignore
                     values = numpy.empty(lw_flt_fshape[1::-1], dtype=float)
-                    for (i, j, _), source in zip(lw_flt_bindex, lw_blocks):
+                    for (i, j, _), source in zip(lw_flt_bindex, lw_blk_values):
                         il, ih = i * lw_sizes[0], (i + 1) * lw_sizes[0]
                         jl, jh = j * lw_sizes[1], (j + 1) * lw_sizes[1]
-                        values[jl:jh, il:ih] = inp_file.read(lw_fld)[source, 0]
+                        values[jl:jh, il:ih] = source[0]
 
-                    x = grids[gr_loc][0][mesh[0], None, :] # type: ignore
-                    y = grids[gr_loc][1][mesh[1], :, None] # type: ignore
-                
                     output[field][step] = numpy.maximum(numpy.minimum(
-                        interpn((yyy, xxx), values, (y, x), method=METHOD, bounds_error=False, fill_value=None),
-                        values.max()), values.min())[None, :, :]
-                    out_file.write_partial(field, output[field][step], block=block, index=gr_lIndex) 
+                        interp_mesh(axes, values, points, weights), values.max()), values.min())[None, :, :]
 
                 else:
                     pass
 
             progress()
+
+        # write the local blocks of each field (collectively if supported) to the output file
+        for field, (location, _, _) in flows.items():
+            out_file.write(field, output[field], shape=shapes[location], index=gr_lIndex, chunks=(1, ) + shapes[location][1:])
             
     return output
 
+def interp_mesh(axes: tuple[N, ...], values: N, points: tuple[N, ...], weights: list[tuple[N, N]] = None) -> N:
+    """(internal) - interpolate (and extrapolate) values on a rectilinear grid onto the mesh spanned by points."""
+    if METHOD != 'linear':
+        return interpn(axes, values, numpy.ix_(*points), method=METHOD, bounds_error=False, fill_value=None)
+
+    # linear interpolation is separable on a rectilinear grid, so apply one axis at a time
+    if weights is None: weights = mesh_weights(axes, points)
+    for axis, (index, weight) in enumerate(weights):
+        weight = weight.reshape((-1, ) + (1, ) * (values.ndim - axis - 1))
+        values = numpy.take(values, index, axis) * (1.0 - weight) + numpy.take(values, index + 1, axis) * weight
+    return values
+
+def mesh_weights(axes: tuple[N, ...], points: tuple[N, ...]) -> list[tuple[N, N]]:
+    """(internal) - locate points along each axis of the grid and calculate the linear interpolation weights."""
+    weights = []
+    for grid, point in zip(axes, points):
+        index = numpy.clip(numpy.searchsorted(grid, point) - 1, 0, grid.size - 2)
+        weights.append((index, (point - grid[index]) / (grid[index + 1] - grid[index])))
+    return weights
+
 def blocks_from_bbox(boxes, box):
     """Return all boxes that at least partially overlap box."""
-    overlaps = lambda ll, lh, hl, hh : not ((hh < ll) or (hl > lh))
-    return [blk for blk, bb in enumerate(boxes)
-            if all(overlaps(*low, *high) for low, high in zip(bb, box))]
+    boxes, box = numpy.asarray(boxes), numpy.asarray(box)
+    overlaps = (boxes[:, :, 0] <= box[:, 1]) & (box[:, 0] <= boxes[:, :, 1])
+    return numpy.flatnonzero(overlaps.all(axis=1)).tolist()
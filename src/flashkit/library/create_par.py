@@ -65,8 +65,7 @@ def sort_templates(templates: list[str], *args) -> int:
 def write_par(*, lines: Lines, path: str) -> None:
     """Write the parameter file to destination."""
     with open(os.path.join(path, FILENAME), 'w') as file:
-        for line in lines:
-            file.write(line + '\n')
+        file.writelines(line + '\n' for line in lines)
 
 def author_section(section: str, layout: Sections, tree: Tree):
     comment = layout.pop(TAGGING, {})
@@ -12,6 +12,7 @@ from ..core.error import LibraryError
 from .types import D, N
 
 # external libraries
+import numpy
 import h5py # type: ignore
 
 # define public interface
@@ -51,10 +52,10 @@ class H5Manager:
         if self.safe:
             self.h5file.close()
 
-    def create_dataset(self, dataset: str, *, shape: tuple, dtype: type) -> None:
+    def create_dataset(self, dataset: str, *, shape: tuple, dtype: type, chunks: tuple = None) -> None:
         """Ensure proper creation of hdf5 dataset based on runtime enviornment."""
         if self.safe:
-            self.h5file.create_dataset(dataset, shape, dtype=dtype)
+            self.h5file.create_dataset(dataset, shape, dtype=dtype, chunks=chunks)
 
     def open(self) -> None:
         """Ensures proper opening of hdf5 file based on runtime enviornment."""
@@ -81,13 +82,14 @@ class H5Manager:
         """Retrieve a hdf5 dataset object; UNSAFE, should wrap in parallel.squash/single."""
         return self.h5file[dataset]
 
-    def write(self, dataset: str, data: N, *, shape: tuple = None, index: parallel.Index = None) -> None:
+    def write(self, dataset: str, data: N, *, shape: tuple = None, index: parallel.Index = None, chunks: tuple = None) -> None:
         """Ensure proper creating and writing of hdf5 dataset based on runtime enviornment."""
         if self.nofile: return
 
         # write hdf5 file serially
         if self.serial:
-            self.h5file.create_dataset(dataset, data=data)
+            dset = self.h5file.create_dataset(dataset, data.shape, dtype=data.dtype, chunks=chunks)
+            self.write_slab(dset, data)
             return
 
         if index is None or shape is None:
@@ -95,27 +97,39 @@ class H5Manager:
 
         # write hdf5 file with parallel support
         if self.supported:
-            dset = self.h5file.create_dataset(dataset, shape, dtype=data.dtype)
-            dset[index.low:index.high+1] = data
+            dset = self.h5file.create_dataset(dataset, shape, dtype=data.dtype, chunks=chunks)
+            self.write_slab(dset, data, low=index.low, collective=True)
             return
 
-        # write hdf5 file without parallel support
+        # write hdf5 file without parallel support (gather all blocks on root)
         comm = parallel.COMM_WORLD
+        data = numpy.ascontiguousarray(data)
+        block = int(numpy.prod(shape[1:]))
+        layout = comm.gather((index.low, index.width), root=parallel.ROOT)
         if parallel.is_root():
-            dset = self.h5file.create_dataset(dataset, shape, dtype=data.dtype)
-            
-        for process in range(index.size):
-            if process == parallel.rank and parallel.is_root():
-                dset[index.low:index.high+1] = data
-
-            if process == parallel.rank and not parallel.is_root():
-                comm.Send(data, dest=parallel.ROOT, tag=process)
-                comm.send((index.low, index.high), dest=parallel.ROOT, tag=process+index.size)
-
-            if process != parallel.rank and parallel.is_root():
-                comm.Recv(data, source=process, tag=process)
-                low, high = comm.recv(source=process, tag=process+index.size)
-                dset[low:high+1] = data
+            counts = numpy.array([width * block for _, width in layout], dtype=int)
+            displs = numpy.array([low * block for low, _ in layout], dtype=int)
+            buffer = numpy.empty(shape, dtype=data.dtype)
+            comm.Gatherv(data, [buffer, (counts, displs)], root=parallel.ROOT)
+            dset = self.h5file.create_dataset(dataset, shape, dtype=data.dtype, chunks=chunks)
+            self.write_slab(dset, buffer)
+        else:
+            comm.Gatherv(data, None, root=parallel.ROOT)
+
+    def write_slab(self, dset: D, data: N, *, low: int = 0, collective: bool = False) -> None:
+        """(internal) - write contiguous data to the leading axis slab of a dataset starting at low."""
+        data = numpy.asarray(data, order='C')
+        mspace = h5py.h5s.create_simple(data.shape)
+        fspace = dset.id.get_space()
+        if not data.size:
+            mspace.select_none()
+            fspace.select_none()
+        elif data.ndim:
+            fspace.select_hyperslab((low, ) + (0, ) * (data.ndim - 1), data.shape)
+        dxpl = h5py.h5p.create(h5py.h5p.DATASET_XFER)
+        if collective and h5py.get_config().mpi:
+            dxpl.set_dxpl_mpio(h5py.h5fd.MPIO_COLLECTIVE)
+        dset.id.write(mspace, fspace, data, dxpl=dxpl)
 
     def write_partial(self, dataset: str, data: N, *, block: int, index: parallel.Index = None) -> None:
         """Ensure proper writing of hdf5 dataset based on runtime enviornment; Must create dataset first."""
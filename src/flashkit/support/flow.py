@@ -44,17 +44,20 @@ SOURCE = CONFIG['support']['flow']['source']
 def constant(*, blocks: M, fields: D, grids: G, mesh: I, shapes: S, const: dict[str, float]) -> None:
     """Method implementing a constant value field initialization."""
     for field, location in fields.items():
-        blocks[field] = numpy.ones(shapes[location], dtype=float) * const[field]
+        blocks[field] = numpy.full(shapes[location], const[field], dtype=float)
 
 def stratified(*, blocks: M, fields: D, grids: G, mesh: I, shapes: S, const: F, scale: F, shift: F) -> None:
     """Method implementing a cold over hot intial condition."""
     ndim = 2 if all(g[2] is None for g in grids.values()) else 3
+    meshed = numpy.fromiter((m[ndim - 1] for m in mesh), dtype=numpy.intp, count=len(mesh))
+    sliced = (slice(None), None, slice(None), None) if ndim == 2 else (slice(None), slice(None), None, None)
     for field, location in fields.items():
-        source = grids[location][ndim - 1]
-        meshed = [m[ndim - 1] for m in mesh]
-        sliced = (slice(None), None, slice(None), None) if ndim == 2 else (slice(None), slice(None), None, None)
-        domain = numpy.heaviside(numpy.array([source[m,:] for m in meshed]) - shift[field], 0.5) * scale[field] + const[field]
-        blocks[field] = numpy.ones(shapes[location], dtype=float) * domain[sliced]
+        domain = grids[location][ndim - 1] - shift[field]
+        numpy.heaviside(domain, 0.5, out=domain)
+        domain *= scale[field]
+        domain += const[field]
+        blocks[field] = numpy.empty(shapes[location], dtype=float)
+        blocks[field][...] = domain[meshed][sliced]
 
 def uniform(*, blocks: M, fields: D, grids: G, mesh: I, shapes: S) -> None:
     """Method implementing a uniform (zero) field initialization."""
@@ -64,6 +67,7 @@ def uniform(*, blocks: M, fields: D, grids: G, mesh: I, shapes: S) -> None:
 class Flowing:
     """Class supporting the dispatching of fields to methods to build initial flow condition."""
     methods: dict[str, str]
+    fields: dict[str, set[str]]
     flow: dict[str, Callable[..., None]]
 
     def __init__(self, methods: D, root: str, *, const: D = {}, freq: D = {}, shift: D = {}, scale: D = {},
@@ -71,17 +75,22 @@ class Flowing:
     
         assert all(method in METHODS for method in methods.values()), 'Unknown Flow Initiation Method Specified!'
         self.methods = dict(methods)
+        self.fields = {}
+        for key, method in methods.items():
+            self.fields.setdefault(method, set()).add(key)
         keys = methods.keys()
 
-        # fully specify the function parameters with defaults if none provided
-        s_const = {key: const.get(key, CONST) for key in keys}
-        s_freq = {key: freq.get(key, FREQ) for key in keys}
-        s_shift = {key: shift.get(key, SHIFT) for key in keys}
-        s_scale = {key: scale.get(key, SCALE) for key in keys}
-        s_function = {key: function.get(key, FUNCTION) for key in keys}
-        s_path = {key: path.get(key, root) for key in keys}
-        s_source = {key: source.get(key, SOURCE) for key in keys}
-        s_meta = {kwarg: {key: value.get(key, None) for key in keys} for kwarg, value in kwargs.items()}
+        # fully specify the function parameters with defaults if none provided (in a single pass)
+        s_const, s_freq, s_shift, s_scale, s_function, s_path, s_source = {}, {}, {}, {}, {}, {}, {}
+        for key in keys:
+            s_const[key] = const.get(key, CONST)
+            s_freq[key] = freq.get(key, FREQ)
+            s_shift[key] = shift.get(key, SHIFT)
+            s_scale[key] = scale.get(key, SCALE)
+            s_function[key] = function.get(key, FUNCTION)
+            s_path[key] = path.get(key, root)
+            s_source[key] = source.get(key, SOURCE)
+        s_meta = {kwarg: dict(zip(keys, map(value.get, keys))) for kwarg, value in kwargs.items()}
         
         self.flow = {
             'constant': partial(constant, const=s_const), 
@@ -91,8 +100,8 @@ class Flowing:
 
     def map_fields(self, check: str) -> set[str]:
         """Which fields does this method need to handle."""
-        return {field for field, method in self.methods.items() if method == check}
+        return set(self.fields.get(check, ()))
 
     def any_fields(self, check: str) -> bool:
         """Does this method need to deal with any fields."""
-        return any(method == check for method in self.methods.values())
+        return check in self.fields
@@ -3,7 +3,11 @@
 # type annotations
 from __future__ import annotations
 
+# standard libraries
+from functools import lru_cache
+
 # internal libraries
+from ..core.error import LibraryError
 from .types import N, Coords, Faces, Grids, Shapes
 
 # external libraries
@@ -13,62 +17,70 @@ import numpy
 __all__ = ['axisMesh', 'axisUniqueIndex', 'get_blocks', 'get_faces', 'get_grids', 'get_shapes', 
            'indexSize_fromGlobal', 'indexSize_fromLocal', ]
 
+@lru_cache(maxsize=16)
 def axisMesh(iProcs: int, jProcs: int, kProcs: int) -> tuple[N, N]:
-    """Create a simple grid of processes along the axes and return the mesh."""
+    """Create a simple grid of processes along the axes and return the mesh; results are cached (read-only)."""
     proc = numpy.array([iProcs, jProcs, kProcs], int)
-    grid = numpy.array([[i, j, k] for k in range(kProcs) for j in range(jProcs) for i in range(iProcs)], int)
+    grid = numpy.ascontiguousarray(numpy.indices((kProcs, jProcs, iProcs), dtype=int).reshape(3, -1).T[:, ::-1])
+    proc.setflags(write=False)
+    grid.setflags(write=False)
     return proc, grid
 
 def axisUniqueIndex(iProcs: int, jProcs: int, kProcs: int) -> tuple[N, N, N]:
     """Create a grid of the unique (i.e., first) indicies and associated processes along each axis."""
-    _, gr_axisMesh = axisMesh(iProcs, jProcs, kProcs)
-    iInd = numpy.array([n for n in range(iProcs)])
-    jInd = numpy.array([n for n, (i, j, k) in enumerate(gr_axisMesh) if i == 0])
-    kInd = numpy.array([n for n, (i, j, k) in enumerate(gr_axisMesh) if i == 0 and j == 0])
+    iInd = numpy.arange(iProcs)
+    jInd = numpy.arange(jProcs) * iProcs
+    kInd = numpy.arange(kProcs) * iProcs * jProcs
     return iInd, jInd, kInd
 
 def get_blocks(*, coords: Coords, ndim: int, procs: tuple[int, int, int], sizes: tuple[int, int, int]) -> tuple[N, N]:
     """Calculate block (center) coordinates and bounding boxes from face arrays."""
 
-    # get the processor communicator layout, grid shapes, and block arrays
+    # get the processor communicator layout and block arrays
     gr_axisNumProcs, gr_axisMesh = axisMesh(*procs)
-    gr_lIndexSize, gr_gIndexSize = indexSize_fromLocal(*sizes, gr_axisNumProcs)
-    gr_gridShapes = get_shapes(ndim=ndim, procs=procs, sizes=sizes)
     (xxxl, xxxc, xxxr), (yyyl, yyyc, yyyr), (zzzl, zzzc, zzzr) = get_faces(coords=coords, ndim=ndim, procs=procs, sizes=sizes)
 
+    # separate the axis mesh by axis for contiguous index gathers
+    iIndex, jIndex, kIndex = (numpy.ascontiguousarray(gr_axisMesh[:, axis]) for axis in range(3))
+
     # create bounding boxes for each block
-    bboxes = numpy.array([((xxxl[i,0], xxxr[i,-1]), (yyyl[j,0], yyyr[j,-1]), (0, 0) if ndim < 3 else (zzzl[k,0], zzzr[k,-1]))
-        for i, j, k in gr_axisMesh], float)
+    bboxes = numpy.zeros((len(gr_axisMesh), 3, 2), dtype=float)
+    bboxes[:, 0, 0], bboxes[:, 0, 1] = xxxl[iIndex, 0], xxxr[iIndex, -1]
+    bboxes[:, 1, 0], bboxes[:, 1, 1] = yyyl[jIndex, 0], yyyr[jIndex, -1]
+    if ndim == 3:
+        bboxes[:, 2, 0], bboxes[:, 2, 1] = zzzl[kIndex, 0], zzzr[kIndex, -1]
     
     # create block centers from bboxes
-    centers = numpy.array([[sum(axis) / 2 for axis in box] for box in bboxes], float)
+    centers = (bboxes[:, :, 0] + bboxes[:, :, 1]) / 2.0
     return centers, bboxes
 
 def get_faces(*, coords: Coords, ndim: int, procs: tuple[int, int, int], sizes: tuple[int, int, int]) -> Faces:
     """Calculate block (unique axis mesh) coordinate arrays from global axis arrays for each face."""
 
-    # get the processor communicator layout and global arrays
-    gr_axisNumProcs, gr_axisMesh = axisMesh(*procs)
-    gr_lIndexSize, gr_gIndexSize = indexSize_fromLocal(*sizes, gr_axisNumProcs)
+    # get the processor communicator layout (blocks per axis), local block sizes, and global arrays
+    gr_axisNumProcs, gr_lIndexSize = tuple(int(p) for p in procs), tuple(int(s) for s in sizes)
     xfaces, yfaces, zfaces = coords
     
-    # calculate the iaxis block coordinates
-    lIndex, lRange = gr_lIndexSize[0], range(gr_axisNumProcs[0])
-    xxxl = numpy.array([xfaces[0 + i * lIndex:0 + (i + 1) * lIndex] for i in lRange], dtype=float)
-    xxxr = numpy.array([xfaces[1 + i * lIndex:1 + (i + 1) * lIndex] for i in lRange], dtype=float)
+    # calculate the iaxis block coordinates (as views of the global axis array)
+    lIndex, lProcs = gr_lIndexSize[0], gr_axisNumProcs[0]
+    xfaces = numpy.asarray(xfaces, dtype=float)
+    xxxl = xfaces[0:0 + lProcs * lIndex].reshape(lProcs, lIndex)
+    xxxr = xfaces[1:1 + lProcs * lIndex].reshape(lProcs, lIndex)
     xxxc = (xxxr + xxxl) / 2.0
 
-    # calculate the jaxis block coordinates
-    lIndex, lRange = gr_lIndexSize[1], range(gr_axisNumProcs[1])
-    yyyl = numpy.array([yfaces[0 + j * lIndex:0 + (j + 1) * lIndex] for j in lRange], dtype=float)
-    yyyr = numpy.array([yfaces[1 + j * lIndex:1 + (j + 1) * lIndex] for j in lRange], dtype=float)
+    # calculate the jaxis block coordinates (as views of the global axis array)
+    lIndex, lProcs = gr_lIndexSize[1], gr_axisNumProcs[1]
+    yfaces = numpy.asarray(yfaces, dtype=float)
+    yyyl = yfaces[0:0 + lProcs * lIndex].reshape(lProcs, lIndex)
+    yyyr = yfaces[1:1 + lProcs * lIndex].reshape(lProcs, lIndex)
     yyyc = (yyyr + yyyl) / 2.0
 
-    # calculate the kaxis block coordinates
-    if zfaces is not None:
-        lIndex, lRange = gr_lIndexSize[2], range(gr_axisNumProcs[2])
-        zzzl = numpy.array([zfaces[0 + k * lIndex:0 + (k + 1) * lIndex] for k in lRange])
-        zzzr = numpy.array([zfaces[1 + k * lIndex:1 + (k + 1) * lIndex] for k in lRange])
+    # calculate the kaxis block coordinates (as views of the global axis array); only used in 3d
+    if ndim == 3 and zfaces is not None:
+        lIndex, lProcs = gr_lIndexSize[2], gr_axisNumProcs[2]
+        zfaces = numpy.asarray(zfaces, dtype=float)
+        zzzl = zfaces[0:0 + lProcs * lIndex].reshape(lProcs, lIndex)
+        zzzr = zfaces[1:1 + lProcs * lIndex].reshape(lProcs, lIndex)
         zzzc = (zzzr + zzzl) / 2.0
     else:
         zzzl, zzzr, zzzc = None, None, None
@@ -78,67 +90,62 @@ def get_faces(*, coords: Coords, ndim: int, procs: tuple[int, int, int], sizes:
 def get_grids(*, coords: Coords, ndim: int, procs: tuple[int, int, int], sizes: tuple[int, int, int]) -> Grids:
     """Calculate block (unique axis mesh) coordinate arrays for each staggered grid from face arrays."""
 
-    # get the processor communicator layout, grid shapes, and block arrays
-    gr_axisNumProcs, gr_axisMesh = axisMesh(*procs)
-    gr_lIndexSize, gr_gIndexSize = indexSize_fromLocal(*sizes, gr_axisNumProcs)
-    gr_gridShapes = get_shapes(ndim=ndim, procs=procs, sizes=sizes)
+    # get the block arrays for each face
     (xxxl, xxxc, xxxr), (yyyl, yyyc, yyyr), (zzzl, zzzc, zzzr) = get_faces(coords=coords, ndim=ndim, procs=procs, sizes=sizes)
 
-    # create the staggered grid coordinate arrays
-    grids = {grid: tuple(numpy.zeros((procs, size), dtype=float) if n < ndim else None 
-        for n, (procs, size) in enumerate(zip(gr_axisNumProcs, shape[::-1]))) for grid, (procs, *shape) in gr_gridShapes.items()}
-
-    # calculate the cell centered coordinates
-    grids['center'][0][:,:] = xxxc[:,:] # type: ignore
-    grids['center'][1][:,:] = yyyc[:,:] # type: ignore
-
-    # calculate the iaxis staggered coordinates
-    grids['facex'][0][:,0] = xxxl[:,0]  # type: ignore
-    grids['facex'][0][:,1:] = xxxr[:,:] # type: ignore
-    grids['facex'][1][:,:] = yyyc[:,:]  # type: ignore
+    # calculate the staggered (face) coordinates along each axis
+    xxxf = numpy.concatenate((xxxl[:, :1], xxxr), axis=1)
+    yyyf = numpy.concatenate((yyyl[:, :1], yyyr), axis=1)
+    zzzf = numpy.concatenate((zzzl[:, :1], zzzr), axis=1) if zzzl is not None else None
 
-    # calculate the jaxis staggered coordinates
-    grids['facey'][0][:,:] = xxxc[:,:]  # type: ignore
-    grids['facey'][1][:,0] = yyyl[:,0]  # type: ignore
-    grids['facey'][1][:,1:] = yyyr[:,:] # type: ignore
-
-    # calculate the kaxis staggered coordinates
-    if ndim == 3:
-        grids['center'][2][:,:] = zzzc[:,:] # type: ignore
-        grids['facex'][2][:,:] = zzzc[:,:]  # type: ignore
-        grids['facey'][2][:,:] = zzzc[:,:]  # type: ignore
-        grids['facez'][0][:,:] = xxxc[:,:]  # type: ignore
-        grids['facez'][1][:,:] = yyyc[:,:]  # type: ignore
-        grids['facez'][2][:,0] = zzzl[:,0]  # type: ignore
-        grids['facez'][2][:,1:] = zzzr[:,:] # type: ignore
-    else:
-        grids['facez'] = (None, None, None)
+    # assemble the staggered grid coordinate arrays (shared between grids; treat as read-only)
+    grids = {
+            'center': (xxxc, yyyc, zzzc),
+            'facex': (xxxf, yyyc, zzzc),
+            'facey': (xxxc, yyyf, zzzc),
+            'facez': (xxxc, yyyc, zzzf) if ndim == 3 else (None, None, None),
+            }
 
     return grids
 
 def get_shapes(*, ndim: int, procs: tuple[int , int, int], sizes: tuple[int, int, int]) -> Shapes:
     """Determine shape of simulation data on the relavent grids (e.g., center or facex)."""
+    return dict(shapes_cached(int(ndim), tuple(int(p) for p in procs), tuple(int(s) for s in sizes)))
+
+@lru_cache(maxsize=32)
+def shapes_cached(ndim: int, procs: tuple[int , int, int], sizes: tuple[int, int, int]) -> Shapes:
+    """(internal) - memoized implementation of get_shapes; callers must not modify the result."""
 
     # get the processor communicator layout and global arrays
-    gr_axisNumProcs, gr_axisMesh = axisMesh(*procs)
-    gr_lIndexSize, gr_gIndexSize = indexSize_fromLocal(*sizes, gr_axisNumProcs)
+    gr_lIndexSize, gr_gIndexSize = indexSize_fromLocal(*sizes, procs)
    
     # create shape data as dictionary
-    shapes = {'center': tuple([gr_axisNumProcs.prod()] + gr_lIndexSize[::-1].tolist())}
-    shapes['facex'] = tuple([gr_axisNumProcs.prod()] + list(gr_lIndexSize[::-1] + (0, 0, 1))) 
-    shapes['facey'] = tuple([gr_axisNumProcs.prod()] + list(gr_lIndexSize[::-1] + (0, 1, 0)))
+    blocks = int(numpy.prod(procs))
+    i, j, k = gr_lIndexSize.tolist()
+    shapes = {'center': (blocks, k, j, i), 'facex': (blocks, k, j, i + 1), 'facey': (blocks, k, j + 1, i)}
     if ndim == 3:
-        shapes['facez'] = tuple([gr_axisNumProcs.prod()] + list(gr_lIndexSize[::-1] + (1, 0, 0)))
+        shapes['facez'] = (blocks, k + 1, j, i)
 
     return shapes
 
 def indexSize_fromGlobal(i: int, j: int, k: int, ijkProcs: N) -> tuple[N, N]:
-    gSizes = numpy.array([i, j, k], int)
-    blocks = numpy.array([size / procs for procs, size in zip(ijkProcs, gSizes)], int)
-    return blocks, gSizes
+    return indexSize_cached(int(i), int(j), int(k), tuple(int(p) for p in ijkProcs), local=False)
 
 def indexSize_fromLocal(i: int, j: int, k: int, ijkProcs: N) -> tuple[N, N]:
-    blocks = numpy.array([i, j, k], int)
-    gSizes = numpy.array([procs * nb for procs, nb in zip(ijkProcs, blocks)], int)
+    return indexSize_cached(int(i), int(j), int(k), tuple(int(p) for p in ijkProcs), local=True)
+
+@lru_cache(maxsize=32)
+def indexSize_cached(i: int, j: int, k: int, ijkProcs: tuple[int, int, int], *, local: bool) -> tuple[N, N]:
+    """(internal) - memoized local (block) and global index sizes; results are read-only."""
+    procs = numpy.array(ijkProcs, dtype=numpy.int64)
+    if local:
+        blocks = numpy.array([i, j, k], dtype=numpy.int64)
+        gSizes = procs * blocks
+    else:
+        gSizes = numpy.array([i, j, k], dtype=numpy.int64)
+        blocks, remainder = numpy.divmod(gSizes, procs)
+        if remainder.any():
+            raise LibraryError('Global grid size is not divisible by the number of blocks!')
+    blocks.setflags(write=False)
+    gSizes.setflags(write=False)
     return blocks, gSizes
-
@@ -6,9 +6,12 @@ from typing import TYPE_CHECKING
 
 # standard libraries
 import os
+import warnings
 from dataclasses import dataclass, field, InitVar
-from functools import partial
-import importlib
+from functools import lru_cache, partial
+from operator import itemgetter
+import importlib.util
+import pkg_resources
 
 # internal libraries
 from ..resources import CONFIG
@@ -20,10 +23,10 @@ import numpy
 # static analysis
 if TYPE_CHECKING:
     from typing import Any, Callable, Iterable, Union
-    from collections.abc import Container, Mapping, MutableSequence, Sequence
-    C = Container[int]
-    I = Iterable[int]
-    F = Iterable[float]
+    from collections.abc import Collection, Mapping, MutableSequence, Sequence
+    C = Collection[int]
+    I = Sequence[int]
+    F = Sequence[float]
     S = Sequence[str]
     D = Mapping[str, Any]
 
@@ -33,81 +36,166 @@ __all__ = ['Stretching', ]
 # define configuration constants (internal)
 AXES = tuple(CONFIG['create']['grid']['axes'])
 METHODS = CONFIG['support']['stretch']['methods']
+BY_AXIS = itemgetter(*AXES)
 
-# define default paramater configuration constants (internal)
-ALPHA = CONFIG['support']['stretch']['alpha']
-COLUMN = tuple(CONFIG['support']['stretch']['column'])
-DELIMITER = CONFIG['support']['stretch']['delimiter']
-HEADER = CONFIG['support']['stretch']['header']
-FUNCTION = tuple(CONFIG['support']['stretch']['function'])
-SOURCE = CONFIG['support']['stretch']['source']
+# define default paramater configuration constants by axis (internal)
+ALPHA = dict.fromkeys(AXES, CONFIG['support']['stretch']['alpha'])
+COLUMN = dict(zip(AXES, CONFIG['support']['stretch']['column']))
+DELIMITER = dict.fromkeys(AXES, CONFIG['support']['stretch']['delimiter'])
+HEADER = dict.fromkeys(AXES, CONFIG['support']['stretch']['header'])
+FUNCTION = dict(zip(AXES, CONFIG['support']['stretch']['function']))
+SOURCE = dict.fromkeys(AXES, CONFIG['support']['stretch']['source'])
 
 def from_ascii(*, source: Iterable[str], column: Iterable[int], delimiter: Iterable[Union[str, int]], header: Iterable[int]) -> Callable[..., None]:
     """Factory method for implementing a ascii file interface for stretching algorithms."""
     def wrapper(*, axes: C, coords: M, sizes: I, ndim: int, smin: F, smax: F) -> None:
         for axis, (s, c, d, h) in enumerate(zip(source, column, delimiter, header)):
             if axis < ndim and axis in axes:
-                coords[axis] = numpy.genfromtxt(fname=s, usecols=(c, ), delimiter=d, skip_header=h, dtype=numpy.float_)   
+                coords[axis] = parse_column(s, column=c, delimiter=d, header=h)
     return wrapper
 
+def parse_column(fname: str, *, column: int, delimiter: Union[str, int, None], header: int) -> N:
+    """(internal) - parse a numeric column from an ascii file; falling back to genfromtxt for irregular files."""
+    if not isinstance(delimiter, int):
+        try:
+            data = fast_column(fname, column=column, delimiter=delimiter, header=header)
+        except ValueError:
+            data = None
+        if data is not None:
+            return data
+    return numpy.genfromtxt(fname=fname, usecols=(column, ), delimiter=delimiter, skip_header=header, dtype=float)
+
+def fast_column(fname: str, *, column: int, delimiter: Union[str, None], header: int) -> Union[N, None]:
+    """(internal) - parse a numeric column from an ascii file using the best supported parser at runtime."""
+    return find_parser()(fname, column=column, delimiter=delimiter, header=header)
+
+@lru_cache(maxsize=None)
+def find_parser() -> Callable[..., Union[N, None]]:
+    """(internal) - resolve (once per runtime environment) the best supported ascii column parser."""
+    try:
+        pkg_resources.get_distribution('pandas')
+        return pandas_column
+    except pkg_resources.DistributionNotFound:
+        return scan_column
+
+def pandas_column(fname: str, *, column: int, delimiter: Union[str, None], header: int) -> N:
+    """(internal) - parse a numeric column from an ascii file using pandas."""
+    import pandas # type: ignore
+    sep = delimiter if delimiter is not None else r'\s+'
+    return pandas.read_csv(fname, sep=sep, header=None, skiprows=header, usecols=[column], comment='#',
+                           engine='c', dtype=float).iloc[:, 0].to_numpy()
+
+def scan_column(fname: str, *, column: int, delimiter: Union[str, None], header: int) -> Union[N, None]:
+    """(internal) - parse a numeric column from a regular ascii file in a single pass; None if not regular."""
+    with open(fname, 'r') as stream:
+        for _ in range(header):
+            stream.readline()
+        text = stream.read().strip()
+    if not text or '#' in text or '\n\n' in text:
+        return None
+    if delimiter:
+        ncols = text.partition('\n')[0].count(delimiter) + 1
+        text = text.replace(delimiter, ' ')
+    else:
+        ncols = len(text.partition('\n')[0].split())
+    nrows = text.count('\n') + 1
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        try:
+            data = numpy.fromstring(text, dtype=float, sep=' ')
+        except (DeprecationWarning, ValueError):
+            return None
+    if column >= ncols or data.size != ncols * nrows:
+        return None
+    return data.reshape(nrows, ncols)[:, column].copy()
+
 def from_python(*, path: Iterable[str], source: Iterable[str], function: Iterable[str], options: Mapping[str, Any]) -> Callable[..., None]:
     """Factory method for implementing a python interface for stretching algorithms."""
+    source = list(source)
+    filenames = [os.path.realpath(os.path.join(p, s + '.py')) for p, s in zip(path, source)]
     def wrapper(*, axes: C, coords: M, sizes: I, ndim: int, smin: F, smax: F) -> None:
-        for axis, (p, s, f, size, low, high) in enumerate(zip(path, source, function, sizes, smin, smax)):
+        modules: dict[str, Any] = {}
+        for axis, (n, s, f, size, low, high) in enumerate(zip(filenames, source, function, sizes, smin, smax)):
             if axis < ndim and axis in axes:
-                loader = importlib.machinery.SourceFileLoader(s, os.path.join(p, s + '.py'))
-                spec = importlib.util.spec_from_loader(loader.name, loader)
-                module = importlib.util.module_from_spec(spec)
-                loader.exec_module(module)
+                module = modules.get(n)
+                if module is None:
+                    spec = importlib.util.spec_from_file_location(s, n)
+                    module = modules[n] = importlib.util.module_from_spec(spec)
+                    spec.loader.exec_module(module)
                 kwargs = {kwarg: value[axis] for kwarg, value in options.items() if value[axis]}
                 coords[axis] = getattr(module, f)(size, low, high, **kwargs)
     return wrapper
 
+@lru_cache(maxsize=8)
+def unit_linspace(size: int) -> N:
+    """(internal) - memoized (read-only) evenly spaced points on [-1, 1] for size cells."""
+    unit = numpy.linspace(-1.0, 1.0, size + 1)
+    unit.setflags(write=False)
+    return unit
+
 def uniform(*, axes: C, coords: M, sizes: I, ndim: int, smin: F, smax: F) -> None:
     """Method implementing a uniform grid algorithm."""
-    for axis, (size, low, high) in enumerate(zip(sizes, smin, smax)):
-        if axis < ndim and axis in axes:
-            coords[axis] = numpy.linspace(low, high, size + 1)
-
-def tanh_mid(*, axes: C, coords: M, sizes: I, ndim: int, smin: F, smax: F, alpha: F) -> None:
-    """Method implementing a symmetric hyperbolic tangent stretching algorithm."""
-    for axis, (size, low, high, a) in enumerate(zip(sizes, smin, smax, alpha)):
-        if axis < ndim and axis in axes:
-            coords[axis] = (high - low) * (numpy.tanh((-1.0 + 2.0 * numpy.linspace(0.0, 1.0, size + 1)) * numpy.arctanh(a)) / a + 1.0) / 2.0 + low
+    for axis in axes:
+        if axis < ndim:
+            size, low, high = int(sizes[axis]), smin[axis], smax[axis]
+            coord = numpy.arange(size + 1, dtype=float)
+            coord *= (high - low) / size
+            coord += low
+            coord[-1] = high
+            coords[axis] = coord
+
+def tanh_mid(*, axes: C, coords: M, sizes: I, ndim: int, smin: F, smax: F, alpha: F, atanh: F) -> None:
+    """Method implementing a symmetric hyperbolic tangent stretching algorithm; atanh is arctanh(alpha)."""
+    for axis in axes:
+        if axis < ndim:
+            size, low, high, a = sizes[axis], smin[axis], smax[axis], alpha[axis]
+            coord = numpy.multiply(unit_linspace(int(size)), atanh[axis])
+            numpy.tanh(coord, out=coord)
+            coord *= (high - low) / (2.0 * a)
+            coord += (high + low) / 2.0
+            coords[axis] = coord
 
 class Stretching:
     """Class supporting the dispatching of axes to methods to build the grid."""
     methods: S
+    axes: dict[str, list[int]]
     stretch: dict[str, Callable[..., None]]
+    active: list[tuple[Callable[..., None], tuple[int, ...]]]
     
     def __init__(self, methods: S, root: str, *, alpha: D = {}, column: D = {}, delimiter: D = {},
                  function: D = {}, header: D = {}, path: D = {}, source: D = {}, **kwargs):
 
         assert all(method in METHODS for method in methods), 'Unkown Stretching Method Specified!'
         self.methods = methods
+        self.axes = {}
+        for axis, method in enumerate(methods):
+            self.axes.setdefault(method, []).append(axis)
         
         # fully specify function parameters with defaults if none provided
-        s_alpha = numpy.array([alpha.get(key, ALPHA) for key in AXES])
-        s_column = [column.get(key, default) for key, default in zip(AXES, COLUMN)]
-        s_delimiter = [delimiter.get(key, DELIMITER) for key in AXES]
-        s_function = [function.get(key, default) for key, default in zip(AXES, FUNCTION)]
-        s_header = [header.get(key, HEADER) for key in AXES]
-        s_path = [path.get(key, root) for key in AXES]
-        s_source = [source.get(key, SOURCE) for key in AXES]
-        s_meta = {kwarg: [value.get(key, None) for key in AXES] for kwarg, value in kwargs.items()}
+        s_alpha = numpy.array(BY_AXIS({**ALPHA, **alpha}), dtype=float)
+        s_column = [int(c) for c in BY_AXIS({**COLUMN, **column})]
+        s_delimiter = list(BY_AXIS({**DELIMITER, **delimiter}))
+        s_function = list(BY_AXIS({**FUNCTION, **function}))
+        s_header = [int(h) for h in BY_AXIS({**HEADER, **header})]
+        s_path = list(BY_AXIS({**dict.fromkeys(AXES, root), **path}))
+        s_source = list(BY_AXIS({**SOURCE, **source}))
+        s_meta = {kwarg: list(BY_AXIS({**dict.fromkeys(AXES), **value})) for kwarg, value in kwargs.items()}
 
         self.stretch = {
                 'ascii': from_ascii(source=[os.path.join(p, s) for p, s in zip(s_path, s_source)], 
                                     column=s_column, delimiter=s_delimiter, header=s_header), 
                 'python': from_python(path=s_path, source=s_source, function=s_function, options=s_meta), 
                 'uniform': uniform,
-                'tanh_mid': partial(tanh_mid, alpha=s_alpha),
+                'tanh_mid': partial(tanh_mid, alpha=s_alpha, atanh=numpy.arctanh(s_alpha)),
                         }
 
+        # resolve the methods (and their axes) in use once, for repeated dispatching
+        self.active = [(func, tuple(self.map_axes(method))) for method, func in self.stretch.items() if self.any_axes(method)]
+
     def map_axes(self, check: str) -> list[int]:
         """Which axes does this method need to handle."""
-        return [axis for axis, method in enumerate(self.methods) if method == check]
+        return list(self.axes.get(check, ()))
     
     def any_axes(self, check: str) -> bool:
         """Does this method need to deal with any axes."""
-        return any(method == check for method in self.methods)
+        return check in self.axes
@@ -0,0 +1,78 @@
+"""Testing the library implementation of the file io support."""
+
+# type annotations
+from __future__ import annotations
+
+# exernal libraries
+import h5py
+import numpy
+import pytest
+
+# internal libraries
+from flashkit.core import parallel
+from flashkit.core.error import LibraryError
+from flashkit.support.files import H5Manager
+
+@pytest.fixture
+def serial(monkeypatch):
+    """Force a serial runtime enviornment."""
+    monkeypatch.setattr(parallel, '_parallel', False)
+
+@pytest.mark.lib
+def check_write(tmp_path, serial):
+    """Verify that a serial write creates the (chunked) dataset with the data."""
+    filename = str(tmp_path.joinpath('blocks.h5'))
+    data = numpy.arange(24, dtype=float).reshape(4, 1, 2, 3)
+    with H5Manager(filename, 'w') as h5file:
+        h5file.write('temp', data, chunks=(1, 1, 2, 3))
+    with h5py.File(filename, 'r') as h5file:
+        assert h5file['temp'].chunks == (1, 1, 2, 3)
+        assert numpy.array_equal(h5file['temp'][()], data)
+
+@pytest.mark.lib
+def check_write_slab(tmp_path, serial):
+    """Verify that slabs are written along the leading axis at an offset (and that empty slabs are allowed)."""
+    filename = str(tmp_path.joinpath('blocks.h5'))
+    data = numpy.arange(24, dtype=float).reshape(4, 2, 3)
+    with H5Manager(filename, 'w') as h5file:
+        h5file.create_dataset('temp', shape=(6, 2, 3), dtype=float)
+        dset = h5file.read('temp')
+        dset[...] = -1.0
+        h5file.write_slab(dset, data[:2], low=1)
+        h5file.write_slab(dset, data[2:], low=4)
+        h5file.write_slab(dset, data[:0], low=6)
+    with h5py.File(filename, 'r') as h5file:
+        result = h5file['temp'][()]
+    assert numpy.array_equal(result[[0, 3]], numpy.full((2, 2, 3), -1.0))
+    assert numpy.array_equal(result[1:3], data[:2])
+    assert numpy.array_equal(result[4:6], data[2:])
+
+@pytest.fixture
+def gathered(monkeypatch):
+    """Force a parallel runtime enviornment without parallel hdf5 support (i.e., gather on root)."""
+    pytest.importorskip('mpi4py')
+    monkeypatch.setattr(parallel, '_parallel', True)
+    monkeypatch.setattr(h5py, 'registered_drivers', lambda: set())
+
+@pytest.mark.lib
+def check_write_gathered(tmp_path, gathered):
+    """Verify that the gather (on root) path writes the local blocks into the full dataset."""
+    filename = str(tmp_path.joinpath('blocks.h5'))
+    index = parallel.Index.from_simple(4)
+    shape = (4, 1, 2, 3)
+    data = numpy.arange(index.width * 6, dtype=float).reshape((index.width, ) + shape[1:]) + index.low * 6
+    with H5Manager(filename, 'w') as h5file:
+        assert not h5file.serial and not h5file.supported
+        h5file.write('temp', data, shape=shape, index=index, chunks=(1, ) + shape[1:])
+    if parallel.is_root():
+        with h5py.File(filename, 'r') as h5file:
+            assert h5file['temp'].chunks == (1, ) + shape[1:]
+            assert numpy.array_equal(h5file['temp'][()], numpy.arange(24, dtype=float).reshape(shape))
+
+@pytest.mark.lib
+def check_write_gathered_requires(tmp_path, gathered):
+    """Verify that writing in parallel requires the index and global shape."""
+    filename = str(tmp_path.joinpath('blocks.h5'))
+    with H5Manager(filename, 'w') as h5file:
+        with pytest.raises(LibraryError):
+            h5file.write('temp', numpy.zeros((1, 1, 2, 3)))
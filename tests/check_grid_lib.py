@@ -0,0 +1,45 @@
+"""Testing the library implementation of the grid support."""
+
+# type annotations
+from __future__ import annotations
+
+# exernal libraries
+import numpy
+import pytest
+
+# internal libraries
+from flashkit.core.error import LibraryError
+from flashkit.support.grid import axisMesh, axisUniqueIndex, indexSize_fromGlobal, indexSize_fromLocal
+
+@pytest.mark.lib
+def check_indexSize():
+    """Verify that local and global index sizes agree (and are read-only)."""
+    blocks, gSizes = indexSize_fromGlobal(12, 8, 1, numpy.array([3, 2, 1]))
+    assert blocks.tolist() == [4, 4, 1]
+    assert gSizes.tolist() == [12, 8, 1]
+    assert not blocks.flags.writeable and not gSizes.flags.writeable
+    blocks, gSizes = indexSize_fromLocal(4, 4, 1, numpy.array([3, 2, 1]))
+    assert blocks.tolist() == [4, 4, 1]
+    assert gSizes.tolist() == [12, 8, 1]
+
+@pytest.mark.lib
+@pytest.mark.parametrize('sizes, procs', [
+    ((10, 8, 1), (3, 2, 1)),
+    ((12, 9, 1), (3, 2, 1)),
+    ((12, 8, 5), (3, 2, 2)),
+    ], ids=['i', 'j', 'k'])
+def check_indexSize_indivisible(sizes, procs):
+    """Verify that a global size not divisible by the blocks raises (on every call, not only the first)."""
+    for _ in range(2):
+        with pytest.raises(LibraryError):
+            indexSize_fromGlobal(*sizes, numpy.array(procs))
+
+@pytest.mark.lib
+@pytest.mark.parametrize('procs', [(3, 2, 1), (3, 2, 4), (1, 3, 2), (2, 1, 3)], ids=['2d', '3d', '3d-i', '3d-j'])
+def check_axisUniqueIndex(procs):
+    """Verify that the unique indices select exactly the first block along each axis (in order)."""
+    _, mesh = axisMesh(*procs)
+    for axis, index in enumerate(axisUniqueIndex(*procs)):
+        assert len(index) == procs[axis]
+        assert mesh[index, axis].tolist() == list(range(procs[axis]))
+        assert not mesh[index][:, [a for a in range(3) if a != axis]].any()
@@ -0,0 +1,44 @@
+"""Testing the library implementation of interp."""
+
+# type annotations
+from __future__ import annotations
+
+# exernal libraries
+import numpy
+import pytest
+from scipy.interpolate import interpn
+
+# internal libraries
+from flashkit.library.create_interp import interp_mesh, mesh_weights
+
+def make_mesh(ndim: int, seed: int):
+    """Create a random rectilinear grid, values, and destination points (with extrapolated and edge points)."""
+    rng = numpy.random.default_rng(seed)
+    axes = tuple(numpy.cumsum(rng.uniform(0.1, 1.0, size)) for size in (9, 8, 7)[:ndim])
+    values = rng.uniform(-1.0, 1.0, tuple(axis.size for axis in axes))
+    points = []
+    for axis in axes:
+        span = axis[-1] - axis[0]
+        inside = rng.uniform(axis[0], axis[-1], 12)
+        outside = numpy.array([axis[0] - 0.25 * span, axis[0] - 1e-3, axis[-1] + 1e-3, axis[-1] + 0.25 * span])
+        points.append(numpy.sort(numpy.concatenate([inside, outside, axis[[0, 1, -2, -1]]])))
+    return axes, values, tuple(points)
+
+@pytest.mark.lib
+@pytest.mark.parametrize('ndim', [2, 3], ids=['2d', '3d'])
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def check_interp_mesh(ndim, seed):
+    """Verify that the separable kernel matches scipy (including linear extrapolation)."""
+    axes, values, points = make_mesh(ndim, seed)
+    expected = interpn(axes, values, numpy.ix_(*points), method='linear', bounds_error=False, fill_value=None)
+    result = interp_mesh(axes, values, points)
+    assert result.shape == expected.shape
+    assert numpy.allclose(result, expected, rtol=1e-12, atol=1e-12)
+
+@pytest.mark.lib
+@pytest.mark.parametrize('ndim', [2, 3], ids=['2d', '3d'])
+def check_interp_mesh_weights(ndim):
+    """Verify that precomputed weights give the same result as computing them on the fly."""
+    axes, values, points = make_mesh(ndim, 3)
+    weights = mesh_weights(axes, points)
+    assert numpy.array_equal(interp_mesh(axes, values, points, weights), interp_mesh(axes, values, points))
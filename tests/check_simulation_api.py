@@ -0,0 +1,35 @@
+"""Testing the api implementation of build simulation."""
+
+# type annotations
+from __future__ import annotations
+
+# exernal libraries
+import pytest
+
+# internal libraries
+from flashkit.api.build._simulation import adapt_arguments
+
+def arguments(source, **kwargs):
+    """Create a fully specified set of build simulation arguments."""
+    args = {'path': 'LidDr/Cavity', 'name': 'Lid', 'ndim': 2, 'nxb': 8, 'nyb': 16, 'nzb': 4, 'grid': 'regular',
+            'python': 3, 'optimize': 'opt', 'subpath': 'INavierStokes/zoso', 'source': str(source), 'site': 'local'}
+    args.update(kwargs)
+    return args
+
+@pytest.mark.api
+def check_setup_2d(tmp_path):
+    """Verify the setup command tokens (and build directory name) for a 2D simulation."""
+    args = adapt_arguments(**arguments(tmp_path))
+    assert args['setup'] == ['./setup3', 'INavierStokes/zoso/LidDr/Cavity/', '+rg', '+hdf5', '-auto', '-opt',
+                             '-objdir=rgLid_8_16', '-site=local', '-2d', '-nxb=8', '-nyb=16']
+    assert args['name'] == 'rgLid_8_16'
+
+@pytest.mark.api
+def check_setup_3d(tmp_path):
+    """Verify the setup command tokens (and build directory name) for a 3D simulation with extra options."""
+    args = adapt_arguments(**arguments(tmp_path, ndim=3, python=2, parallelIO=True, shortcuts=['pm4dev'],
+                                       flags=['debug'], variables={'maxblocks': 100, 'nrefs': 2}))
+    assert args['setup'] == ['./setup', 'INavierStokes/zoso/LidDr/Cavity/', '+rg', '+hdf5', '+parallelIO', '+pm4dev',
+                             '-auto', '-opt', '-debug', '-objdir=rgLid_8_16_4', '-site=local', '-3d', '-nxb=8', '-nyb=16',
+                             '-nzb=4', '-maxblocks=100', '-nrefs=2']
+    assert args['name'] == 'rgLid_8_16_4'
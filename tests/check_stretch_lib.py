@@ -0,0 +1,54 @@
+"""Testing the library implementation of the stretching support."""
+
+# type annotations
+from __future__ import annotations
+
+# exernal libraries
+import numpy
+import pytest
+
+# internal libraries
+from flashkit.support.stretch import parse_column, pandas_column
+
+REGULAR = [
+    ('# x y z\n0.0 1.0 2.0\n0.5 1.5 2.5\n1.0 2.0 3.0\n', None),
+    ('# x,y,z\n0.0,1.0,2.0\n0.5,1.5,2.5\n1.0,2.0,3.0\n', ','),
+    ('# x,y,z\n0.0, 1.0, 2.0\n0.5, 1.5, 2.5\n1.0, 2.0, 3.0\n', ','),
+    ]
+REGULAR_IDS = ['whitespace', 'comma', 'comma-space']
+
+@pytest.mark.lib
+@pytest.mark.parametrize('text, delimiter', REGULAR, ids=REGULAR_IDS)
+def check_parse_column(tmp_path, text, delimiter):
+    """Verify that regular files are parsed the same as genfromtxt."""
+    fname = tmp_path.joinpath('axis.txt')
+    fname.write_text(text)
+    for column in range(3):
+        parsed = parse_column(str(fname), column=column, delimiter=delimiter, header=1)
+        expected = numpy.genfromtxt(fname=str(fname), usecols=(column, ), delimiter=delimiter, skip_header=1, dtype=float)
+        assert numpy.array_equal(parsed, expected)
+
+@pytest.mark.lib
+@pytest.mark.parametrize('text, delimiter', REGULAR, ids=REGULAR_IDS)
+def check_parse_column_pandas(tmp_path, text, delimiter):
+    """Verify that regular files are parsed by pandas (if installed) the same as genfromtxt."""
+    pytest.importorskip('pandas')
+    fname = tmp_path.joinpath('axis.txt')
+    fname.write_text(text)
+    for column in range(3):
+        parsed = pandas_column(str(fname), column=column, delimiter=delimiter, header=1)
+        expected = numpy.genfromtxt(fname=str(fname), usecols=(column, ), delimiter=delimiter, skip_header=1, dtype=float)
+        assert numpy.array_equal(parsed, expected)
+
+@pytest.mark.lib
+@pytest.mark.parametrize('column, expected', [
+    (0, [1.0, 4.0]),
+    (1, [numpy.nan, numpy.nan]),
+    (2, [3.0, 6.0]),
+    ], ids=['first', 'empty', 'last'])
+def check_parse_column_empty(tmp_path, column, expected):
+    """Verify that empty delimited fields are parsed as nan (as with genfromtxt)."""
+    fname = tmp_path.joinpath('axis.txt')
+    fname.write_text('1,,3\n4,,6\n')
+    parsed = parse_column(str(fname), column=column, delimiter=',', header=0)
+    assert numpy.array_equal(parsed, expected, equal_nan=True)